@@ -0,0 +1,48 @@
+import copy
+import random
+import timeit
+import tracemalloc
+from grad_engine import Value
+from nn import Layer, SparseLayer
+
+"""
+Compare inference latency and memory of a dense Layer against magnitude pruned SparseLayers
+
+memory is measured as bytes allocated when deep copying the layer (i.e. the Value objects + CSR index lists),
+latency is the mean time of one forward pass (graph construction included, as that is what inference costs here)
+"""
+
+NIN, NOUT = 64, 64
+REPEATS = 20
+
+
+def measure_memory(layer):
+    tracemalloc.start()
+    layer_copy = copy.deepcopy(layer)  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def measure_latency(layer, inputs):
+    return timeit.timeit(lambda: layer(inputs), number=REPEATS) / REPEATS
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    dense = Layer(NIN, NOUT)
+    inputs = [Value(random.uniform(-1.0, 1.0)) for _ in range(NIN)]
+
+    layers = [("dense", dense)]
+    for sparsity in (0.1, 0.5, 0.9):
+        layers.append((f"sparse {sparsity:.0%}", SparseLayer.from_dense(dense, density=1.0 - sparsity)))
+
+    dense(inputs)  # warm up
+    results = [(name, layer, measure_latency(layer, inputs), measure_memory(layer)) for name, layer in layers]
+    _, _, dense_latency, dense_memory = results[0]
+
+    print(f"{NIN}x{NOUT} layer, {REPEATS} forward passes")
+    print(f"{'layer':<12}{'params':>8}{'latency (ms)':>14}{'speedup':>9}{'memory (KiB)':>14}{'ratio':>7}")
+    for name, layer, latency, memory in results:
+        print(f"{name:<12}{len(layer.parameters()):>8}{latency * 1e3:>14.3f}{dense_latency / latency:>9.2f}"
+              f"{memory / 1024:>14.1f}{memory / dense_memory:>7.2f}")
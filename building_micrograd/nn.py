@@ -72,6 +72,72 @@ class Layer:
         return self.forward(*args, **kwds)
 
 
+class SparseLayer:
+    """
+    same maths as Layer, but weights stored in CSR (compressed sparse row) form
+    row i is output neuron i, only non-zero connections are stored:
+        weights[row_ptr[i]:row_ptr[i + 1]] - the non-zero weights of neuron i
+        col_idx[row_ptr[i]:row_ptr[i + 1]] - which input each of those weights reads
+    forward only builds graph nodes for stored connections, so backward only touches them too
+    """
+
+    def __init__(self, nin, nout, row_ptr, col_idx, weights, biases, activation_fn=lambda x: x):
+        assert len(row_ptr) == nout + 1 and row_ptr[0] == 0 and row_ptr[-1] == len(weights)
+        assert len(col_idx) == len(weights) and len(biases) == nout
+        assert all(0 <= j < nin for j in col_idx)
+        self.nin = nin
+        self.nout = nout
+        self.row_ptr = row_ptr
+        self.col_idx = col_idx
+        self.weights = weights
+        self.biases = biases
+        self.activation_fn = activation_fn
+
+    @classmethod
+    def from_dense(cls, layer, density=1.0):
+        """
+        magnitude pruning: keep the round(density * nin * nout) largest |weight| connections of a dense Layer
+        kept weights and biases are the same Value objects as in the dense layer (i.e. trained values carry over)
+        """
+        assert 0.0 <= density <= 1.0
+        nout = len(layer.neurons)
+        nin = len(layer.neurons[0].weights)
+        n_keep = round(density * nin * nout)
+        ranked = sorted(((i, j) for i in range(nout) for j in range(nin)),
+                        key=lambda ij: abs(layer.neurons[ij[0]].weights[ij[1]].data), reverse=True)
+        kept = sorted(ranked[:n_keep])  # back into row-major order for CSR
+
+        row_ptr, col_idx, weights = [0], [], []
+        k = 0
+        for i in range(nout):
+            while k < len(kept) and kept[k][0] == i:
+                col_idx.append(kept[k][1])
+                weights.append(layer.neurons[i].weights[kept[k][1]])
+                k += 1
+            row_ptr.append(len(weights))
+
+        biases = [neuron.bias for neuron in layer.neurons]
+        return cls(nin, nout, row_ptr, col_idx, weights, biases, layer.neurons[0].activation_fn)
+
+    def density(self):
+        return len(self.weights) / (self.nin * self.nout)
+
+    def parameters(self):
+        return self.weights + self.biases
+
+    def forward(self, inputs):
+        assert (len(inputs) == self.nin)
+        outputs = []
+        for i in range(self.nout):
+            start, end = self.row_ptr[i], self.row_ptr[i + 1]
+            weighted_inputs = (self.weights[k] * inputs[self.col_idx[k]] for k in range(start, end))
+            outputs.append(self.activation_fn(sum(weighted_inputs, self.biases[i])))
+        return outputs
+
+    def __call__(self, *args, **kwds):
+        return self.forward(*args, **kwds)
+
+
 class MLP:
 
     def __init__(self, nin, layer_sizes, loss_fn=None):
@@ -92,6 +158,14 @@ class MLP:
                 print(layer.parameters())
         return [param for layer in self.layers for param in layer.parameters()]
 
+    def prune(self, density):
+        """
+        magnitude prune every layer to the target density (fraction of weights kept), replacing it with a SparseLayer
+        """
+        assert all(isinstance(layer, Layer) for layer in self.layers), "MLP has already been pruned"
+        self.layers = [SparseLayer.from_dense(layer, density) for layer in self.layers]
+        return self
+
     def forward(self, inputs):
         x = inputs
         for layer in self.layers:
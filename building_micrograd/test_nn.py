@@ -0,0 +1,71 @@
+import random
+import unittest
+from grad_engine import Value
+from nn import Layer, MLP, SparseLayer
+
+
+class TestSparseLayer(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+
+    def test_csr_forward(self):
+        # [[2, 0, 3],
+        #  [0, 0, 0],
+        #  [0, 4, 0]]
+        layer = SparseLayer(3, 3, row_ptr=[0, 2, 2, 3], col_idx=[0, 2, 1],
+                            weights=[Value(2.0), Value(3.0), Value(4.0)], biases=[Value(1.0), Value(5.0), Value(0.5)])
+        out = layer([Value(1.0), Value(2.0), Value(3.0)])
+        self.assertEqual([o.data for o in out], [12.0, 5.0, 8.5])
+
+    def test_full_density_matches_dense(self):
+        dense = Layer(4, 3)
+        sparse = SparseLayer.from_dense(dense, density=1.0)
+        self.assertEqual(len(sparse.parameters()), len(dense.parameters()))
+
+        inputs = [Value(x) for x in (0.5, -1.0, 2.0, 1.5)]
+        dense_out = dense(inputs)
+        sparse_out = sparse(inputs)
+        for d, s in zip(dense_out, sparse_out):
+            self.assertAlmostEqual(d.data, s.data)
+
+    def test_backward_only_touches_kept_weights(self):
+        dense = Layer(4, 2)
+        sparse = SparseLayer.from_dense(dense, density=0.5)
+        self.assertEqual(len(sparse.weights), 4)
+        kept = set(sparse.weights)
+        pruned = [w for neuron in dense.neurons for w in neuron.weights if w not in kept]
+
+        inputs = [Value(x) for x in (0.5, -1.0, 2.0, 1.5)]
+        out = sparse(inputs)
+        loss = out[0] + out[1]
+        loss.backward()
+        for i in range(sparse.nout):
+            for k in range(sparse.row_ptr[i], sparse.row_ptr[i + 1]):
+                x = inputs[sparse.col_idx[k]].data
+                self.assertAlmostEqual(sparse.weights[k].grad, x)
+        for w in pruned:
+            self.assertEqual(w.grad, 0)
+
+    def test_magnitude_pruning_keeps_largest(self):
+        dense = Layer(5, 4)
+        sparse = SparseLayer.from_dense(dense, density=0.25)
+        self.assertEqual(sparse.density(), 0.25)
+        all_magnitudes = sorted(abs(w.data) for neuron in dense.neurons for w in neuron.weights)
+        kept_magnitudes = sorted(abs(w.data) for w in sparse.weights)
+        self.assertEqual(kept_magnitudes, all_magnitudes[-5:])
+
+    def test_mlp_prune(self):
+        mlp = MLP(3, [4, 4, 1])
+        n_dense = len(mlp.parameters())
+        mlp.prune(0.5)
+        self.assertTrue(all(isinstance(layer, SparseLayer) for layer in mlp.layers))
+        n_biases = 4 + 4 + 1
+        n_weights = round(0.5 * 12) + round(0.5 * 16) + round(0.5 * 4)
+        self.assertEqual(len(mlp.parameters()), n_weights + n_biases)
+        self.assertLess(len(mlp.parameters()), n_dense)
+        self.assertIsInstance(mlp.forward([Value(1.0), Value(2.0), Value(3.0)]), Value)
+
+
+if __name__ == "__main__":
+    unittest.main()